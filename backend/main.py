@@ -1,12 +1,30 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional, Tuple
+import os
+import functools
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import uvicorn
+
+# Expandable segments let the CUDA caching allocator grow blocks in place instead of
+# re-allocating when generate shapes change; must be set before torch touches CUDA.
+# There is no release threshold to raise here: that is a cudaMallocAsync pool
+# attribute and doesn't apply to the native allocator used with expandable_segments
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True,max_split_size_mb:512")
+
 import torch
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+from transformers import AutoTokenizer, AutoModelForSeq2SeqLM, BitsAndBytesConfig
+from transformers.utils import is_bitsandbytes_available
 import logging
 
+try:
+    import ctranslate2
+except ImportError:
+    ctranslate2 = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,10 +45,72 @@ MODEL_NAME = "facebook/nllb-200-distilled-600M"
 MAX_TEXT_LENGTH = 5000  # Maximum characters per request
 MAX_INPUT_TOKENS = 1024  # Maximum tokens for model input (increased from 512)
 MAX_OUTPUT_TOKENS = 2048  # Maximum tokens for model output (longer than input to handle expansion)
+MIN_OUTPUT_TOKENS = 64  # Minimum generation budget, even for very short inputs
+OUTPUT_TOKEN_RATIO = 2.0  # Output tokens allowed per input token
+BATCH_WINDOW_SECONDS = 0.025  # How long to collect concurrent requests into one batch
+MIN_BATCH_SIZE = 4  # Minimum chunks per batched generate call
+MAX_BATCH_SIZE = 8  # Maximum chunks per batched generate call
+# Pre-converted CTranslate2 model, e.g.:
+# ct2-transformers-converter --model facebook/nllb-200-distilled-600M --quantization int8 --output_dir models/nllb-200-distilled-600M-ct2
+CT2_MODEL_DIR = os.environ.get("CT2_MODEL_DIR", "models/nllb-200-distilled-600M-ct2")
+CT2_COMPUTE_TYPE = "int8"
+# Optional draft model for assisted (speculative) generation. It must share the NLLB
+# tokenizer/vocabulary; facebook/nllb-200-distilled-600M is already the smallest
+# official NLLB-200 checkpoint, so this is off unless a smaller one is provided
+ASSISTANT_MODEL_NAME = os.environ.get("ASSISTANT_MODEL_NAME")
+CUDA_MEMORY_FRACTION = 0.9  # Share of GPU memory the process may reserve
+WARMUP_NEW_TOKENS = 256  # Decode length for the startup warm-up generate
+TOKEN_COUNT_CACHE_SIZE = 4096  # Entries kept in the token count cache
+TOKEN_COUNT_CACHE_MAX_CHARS = 2048  # Only texts shorter than this are cached
+
+# Sentence boundary markers (common across many languages)
+# Khmer uses ។ (U+17D4) as sentence delimiter
+SENTENCE_ENDINGS = '.!?\n។。！？'
+
+# Language code prefixes whose scripts tokenize denser than Latin text
+COMPLEX_SCRIPTS = frozenset({"khm_", "zho_", "jpn_", "tha_", "kor_"})
+
+# Languages exposed through /languages (NLLB codes)
+SUPPORTED_LANGUAGES = [
+    {"code": "eng_Latn", "name": "English"},
+    {"code": "khm_Khmr", "name": "Khmer"},
+    {"code": "spa_Latn", "name": "Spanish"},
+    {"code": "fra_Latn", "name": "French"},
+    {"code": "deu_Latn", "name": "German"},
+    {"code": "ita_Latn", "name": "Italian"},
+    {"code": "por_Latn", "name": "Portuguese"},
+    {"code": "rus_Cyrl", "name": "Russian"},
+    {"code": "zho_Hans", "name": "Chinese (Simplified)"},
+    {"code": "zho_Hant", "name": "Chinese (Traditional)"},
+    {"code": "jpn_Jpan", "name": "Japanese"},
+    {"code": "kor_Hang", "name": "Korean"},
+    {"code": "ara_Arab", "name": "Arabic"},
+    {"code": "hin_Deva", "name": "Hindi"},
+    {"code": "tha_Thai", "name": "Thai"},
+    {"code": "vie_Latn", "name": "Vietnamese"},
+    {"code": "ind_Latn", "name": "Indonesian"},
+    {"code": "tam_Taml", "name": "Tamil"},
+    {"code": "tur_Latn", "name": "Turkish"},
+    {"code": "pol_Latn", "name": "Polish"},
+]
 
 # Global variables for model and tokenizer
 model = None
 tokenizer = None
+translator = None  # CTranslate2 translator, used instead of model when available
+assistant_model = None  # Draft model for assisted generation, if ASSISTANT_MODEL_NAME is set
+LANG_BOS = {}  # Language code -> token ID, filled at startup
+LANG_CODES = frozenset()  # Every language code token the tokenizer knows, filled at startup
+MODEL_DEVICE = None  # torch.device holding the model weights, set at startup
+COPY_STREAM = None  # CUDA stream for host-to-device input copies (GPU only)
+CHUNK_EXECUTOR = None  # Thread pool for concurrent chunk translation, created at startup
+CHUNK_WORKERS = 1  # Number of workers in CHUNK_EXECUTOR
+REQUEST_QUEUE = None  # asyncio.Queue of pending single-chunk requests, created at startup
+BATCHER_TASK = None  # Background task that drains REQUEST_QUEUE
+BATCH_SLOTS = None  # asyncio.Semaphore limiting batcher batches in flight to CHUNK_WORKERS
+# The tokenizer is shared across threads and src_lang is mutable state, so
+# setting the language and encoding/decoding must happen atomically
+TOKENIZER_LOCK = threading.RLock()
 
 
 class TranslationRequest(BaseModel):
@@ -45,31 +125,170 @@ class TranslationResponse(BaseModel):
     target_lang: str
 
 
+def cpu_supports_bf16() -> bool:
+    """Check whether the CPU has native BF16 support through oneDNN."""
+    try:
+        return torch.backends.mkldnn.is_available() and torch.ops.mkldnn._is_mkldnn_bf16_supported()
+    except Exception:
+        return False
+
+
+def supports_torch_compile() -> bool:
+    """Check whether the installed PyTorch has a usable torch.compile (>= 2.1)."""
+    try:
+        major, minor = (int(part) for part in torch.__version__.split(".")[:2])
+    except ValueError:
+        return False
+    return hasattr(torch, "compile") and (major, minor) >= (2, 1)
+
+
+def warmup_model():
+    """
+    Run a dummy generate to trigger compilation at startup.
+    On GPU it decodes a fixed WARMUP_NEW_TOKENS with beam 5 so the caching
+    allocator reserves KV cache buffers before the first real request; other
+    devices have no such allocator, so a short greedy generate is enough there.
+    """
+    try:
+        logger.info("Warming up model...")
+        with TOKENIZER_LOCK:
+            set_src_lang("eng_Latn")
+            inputs = tokenizer(["Hello, world."], return_tensors="pt")
+        inputs = inputs.to(MODEL_DEVICE)
+        if MODEL_DEVICE.type == "cuda":
+            warmup_kwargs = {"num_beams": 5, "min_new_tokens": WARMUP_NEW_TOKENS, "max_new_tokens": WARMUP_NEW_TOKENS}
+        else:
+            warmup_kwargs = {"num_beams": 1, "max_new_tokens": 8}
+        with torch.inference_mode():
+            model.generate(
+                **inputs,
+                forced_bos_token_id=get_lang_token_id("fra_Latn"),
+                do_sample=False,
+                **warmup_kwargs
+            )
+        logger.info("Warm-up complete")
+    except Exception as e:
+        logger.warning(f"Model warm-up failed: {str(e)}")
+
+
 @app.on_event("startup")
 async def load_model():
     """Load the NLLB-200 model and tokenizer on startup."""
-    global model, tokenizer
+    global model, tokenizer, translator, assistant_model, LANG_BOS, LANG_CODES, CHUNK_EXECUTOR, CHUNK_WORKERS, MODEL_DEVICE, COPY_STREAM
+    global REQUEST_QUEUE, BATCHER_TASK, BATCH_SLOTS
     try:
         logger.info(f"Loading model {MODEL_NAME}...")
         logger.info("This may take a few minutes on first run...")
         
         # Load tokenizer
-        tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
+        # Rust-backed fast tokenizer: needed for offset mappings and batched encoding
+        tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME, use_fast=True)
+        
+        # NLLB registers its language codes (eng_Latn, khm_Khmr, ...) as additional special tokens
+        LANG_CODES = frozenset(tokenizer.additional_special_tokens)
+        
+        # Cache language token IDs so generate doesn't look them up per chunk
+        LANG_BOS = {
+            lang["code"]: tokenizer.convert_tokens_to_ids(lang["code"])
+            for lang in SUPPORTED_LANGUAGES
+        }
         
         # Load model - use CPU if CUDA is not available
         device = "cuda" if torch.cuda.is_available() else "cpu"
         logger.info(f"Using device: {device}")
         
-        model = AutoModelForSeq2SeqLM.from_pretrained(MODEL_NAME)
-        model.to(device)
+        use_ct2 = ctranslate2 is not None and os.path.isdir(CT2_MODEL_DIR)
+        
+        # On GPU two workers run whole sub-batches concurrently to keep the device busy
+        # between batches. A CPU torch generate already uses every core through its
+        # intra-op pool, so a second worker would only oversubscribe them; CTranslate2
+        # runs concurrent batches itself, one per inter_threads worker
+        CHUNK_WORKERS = 2 if device == "cuda" or use_ct2 else 1
+        CHUNK_EXECUTOR = ThreadPoolExecutor(max_workers=CHUNK_WORKERS, thread_name_prefix="translate")
+        logger.info(f"Chunk translation workers: {CHUNK_WORKERS}")
+        
+        # Micro-batcher for concurrent single-chunk requests
+        REQUEST_QUEUE = asyncio.Queue()
+        BATCH_SLOTS = asyncio.Semaphore(CHUNK_WORKERS)
+        BATCHER_TASK = asyncio.create_task(batch_requests())
+        BATCHER_TASK.add_done_callback(log_batcher_exit)
+        
+        if use_ct2:
+            # CTranslate2 INT8 engine replaces the HF model for generation
+            logger.info(f"Loading CTranslate2 model from {CT2_MODEL_DIR} ({CT2_COMPUTE_TYPE})")
+            translator = ctranslate2.Translator(
+                CT2_MODEL_DIR,
+                device=device,
+                compute_type=CT2_COMPUTE_TYPE,
+                inter_threads=CHUNK_WORKERS,
+                # Split the cores between the concurrent batches (0 = CTranslate2 default)
+                intra_threads=max(1, (os.cpu_count() or CHUNK_WORKERS) // CHUNK_WORKERS) if device == "cpu" else 0
+            )
+            logger.info("Model loaded successfully!")
+            return
+        
+        if device == "cuda" and is_bitsandbytes_available():
+            # INT8 weights via bitsandbytes; device_map places the model on the GPU
+            logger.info("Loading model with INT8 weights (bitsandbytes)")
+            model = AutoModelForSeq2SeqLM.from_pretrained(
+                MODEL_NAME,
+                quantization_config=BitsAndBytesConfig(load_in_8bit=True),
+                device_map="auto"
+            )
+        else:
+            if device == "cpu" and cpu_supports_bf16():
+                # BF16 halves weight bandwidth on CPUs with native BF16 support
+                logger.info("Loading model with BF16 weights")
+                model = AutoModelForSeq2SeqLM.from_pretrained(MODEL_NAME, torch_dtype=torch.bfloat16)
+            else:
+                model = AutoModelForSeq2SeqLM.from_pretrained(MODEL_NAME)
+            model.to(device)
         model.eval()  # Set to evaluation mode
         
+        # Resolve the device once (device_map may have picked it) instead of per chunk
+        MODEL_DEVICE = next(model.parameters()).device
+        
+        if device == "cuda":
+            torch.cuda.set_per_process_memory_fraction(CUDA_MEMORY_FRACTION, device=0)
+            COPY_STREAM = torch.cuda.Stream(device=MODEL_DEVICE)
+        
+        if ASSISTANT_MODEL_NAME:
+            # Draft model proposes tokens that the main model verifies in one forward pass
+            logger.info(f"Loading assistant model {ASSISTANT_MODEL_NAME} for assisted generation...")
+            assistant_model = AutoModelForSeq2SeqLM.from_pretrained(ASSISTANT_MODEL_NAME, torch_dtype=model.dtype)
+            assistant_model.to(MODEL_DEVICE)
+            assistant_model.eval()
+        
+        # Compile the forward pass used by every decoder step in generate
+        # (bitsandbytes INT8 layers are not compile-friendly, so skip them).
+        # The KV cache length changes every step and batch size / beam width change
+        # per call, so use dynamic shapes without CUDA graphs: "reduce-overhead"
+        # would record a graph per shape and its graph trees are per-thread,
+        # which doesn't fit generate running on several worker threads
+        if supports_torch_compile() and not getattr(model, "is_loaded_in_8bit", False):
+            logger.info("Compiling model forward with torch.compile...")
+            model.forward = torch.compile(model.forward, mode="default", dynamic=True, fullgraph=False)
+        
         logger.info("Model loaded successfully!")
+        
+        # Run one generate so compilation and allocation happen before the first request
+        warmup_model()
     except Exception as e:
         logger.error(f"Error loading model: {str(e)}")
         raise Exception(f"Failed to load translation model: {str(e)}")
 
 
+@app.on_event("shutdown")
+async def stop_batcher():
+    """Cancel the micro-batcher task on shutdown."""
+    if BATCHER_TASK is not None and not BATCHER_TASK.done():
+        BATCHER_TASK.cancel()
+        try:
+            await BATCHER_TASK
+        except asyncio.CancelledError:
+            pass
+
+
 @app.get("/")
 async def root():
     return {
@@ -82,87 +301,517 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint that verifies model is loaded."""
-    if model is None or tokenizer is None:
+    if (model is None and translator is None) or tokenizer is None:
         raise HTTPException(status_code=503, detail="Model not loaded")
     return {
         "status": "healthy",
-        "model_loaded": model is not None,
+        "model_loaded": model is not None or translator is not None,
         "tokenizer_loaded": tokenizer is not None
     }
 
 
-def translate_chunk(text_chunk: str, source_lang: str, target_lang: str) -> str:
+def set_src_lang(source_lang: str):
+    """Set the tokenizer source language, skipping the update if it is unchanged."""
+    if tokenizer.src_lang != source_lang:
+        tokenizer.src_lang = source_lang
+
+
+def get_lang_token_id(lang_code: str) -> int:
     """
-    Translate a single chunk of text.
-    Helper function for chunking long texts.
-    """
-    # Set source language code for tokenizer
-    tokenizer.src_lang = source_lang
-    
-    # Tokenize input text
-    inputs = tokenizer(
-        text_chunk,
-        return_tensors="pt",
-        truncation=True,
-        max_length=MAX_INPUT_TOKENS,
-        padding=True
+    Get the token ID for a language code, caching valid codes outside SUPPORTED_LANGUAGES.
+    
+    Raises:
+        KeyError: If the code is not one of the tokenizer's language tokens
+    """
+    token_id = LANG_BOS.get(lang_code)
+    if token_id is None:
+        # Ordinary vocabulary entries (e.g. "▁the") are not language codes;
+        # only real codes are cached, so the cache is bounded by LANG_CODES
+        if lang_code not in LANG_CODES:
+            raise KeyError(lang_code)
+        token_id = tokenizer.convert_tokens_to_ids(lang_code)
+        LANG_BOS[lang_code] = token_id
+    return token_id
+
+
+def get_batch_size() -> int:
+    """
+    Pick how many chunks to send through model.generate at once.
+    On GPU this is sized from free device memory; on CPU a small fixed batch is used.
+    """
+    if assistant_model is not None:
+        # Assisted generation in transformers only supports one sequence per call
+        return 1
+    
+    if not torch.cuda.is_available():
+        return MIN_BATCH_SIZE
+    
+    try:
+        free_bytes, _ = torch.cuda.mem_get_info()
+    except Exception as e:
+        logger.warning(f"Could not query free GPU memory, using minimum batch size: {str(e)}")
+        return MIN_BATCH_SIZE
+    
+    # Roughly 1 GB of free memory per chunk for beam search at full input length
+    batch_size = int(free_bytes // (1024 ** 3))
+    return max(MIN_BATCH_SIZE, min(MAX_BATCH_SIZE, batch_size))
+
+
+def get_num_beams(input_tokens: int) -> int:
+    """
+    Pick the beam width for an input length.
+    Short inputs gain little from wide beams, so they use greedy or beam 2.
+    """
+    if input_tokens < 64:
+        return 1
+    if input_tokens < 256:
+        return 2
+    return 5
+
+
+def get_max_new_tokens(input_tokens: int) -> int:
+    """
+    Size the generation budget to the input instead of always reserving
+    MAX_OUTPUT_TOKENS, which keeps the KV cache small for short inputs.
+    """
+    return min(MAX_OUTPUT_TOKENS, max(MIN_OUTPUT_TOKENS, int(input_tokens * OUTPUT_TOKEN_RATIO)))
+
+
+def translate_batch_ct2(chunks: list, source_lang: str, target_lang: str) -> list:
+    """
+    Translate a list of text chunks with the CTranslate2 INT8 engine.
+    Uses the same decoding settings as the HF generate path.
+    """
+    with TOKENIZER_LOCK:
+        set_src_lang(source_lang)
+        
+        # CTranslate2 works on token strings; encode() adds the source language code and </s>
+        source_tokens = [
+            tokenizer.convert_ids_to_tokens(
+                tokenizer.encode(chunk, truncation=True, max_length=MAX_INPUT_TOKENS)
+            )
+            for chunk in chunks
+        ]
+    
+    # Size the search to the longest input, as the HF path does per sub-batch
+    in_tokens = max(len(tokens) for tokens in source_tokens)
+    
+    results = translator.translate_batch(
+        source_tokens,
+        target_prefix=[[target_lang]] * len(chunks),
+        max_batch_size=get_batch_size(),
+        beam_size=get_num_beams(in_tokens),
+        length_penalty=1.2,
+        no_repeat_ngram_size=3,
+        repetition_penalty=1.1,
+        max_decoding_length=get_max_new_tokens(in_tokens)
     )
     
-    # Move inputs to same device as model
-    device = next(model.parameters()).device
-    inputs = {k: v.to(device) for k, v in inputs.items()}
+    translated_texts = []
+    with TOKENIZER_LOCK:
+        for result in results:
+            # Drop the target language prefix before decoding
+            target_tokens = result.hypotheses[0][1:]
+            translated_texts.append(tokenizer.decode(
+                tokenizer.convert_tokens_to_ids(target_tokens),
+                skip_special_tokens=True
+            ))
     
-    # Get target language token ID
-    token_ids = tokenizer.convert_tokens_to_ids([target_lang])
-    forced_bos_token_id = token_ids[0]
-    
-    # Generate translation
-    with torch.no_grad():
-        translated_tokens = model.generate(
-            **inputs,
-            forced_bos_token_id=forced_bos_token_id,
-            max_length=MAX_OUTPUT_TOKENS,
-            max_new_tokens=MAX_OUTPUT_TOKENS,
-            num_beams=5,
-            early_stopping=False,
-            length_penalty=1.2,
-            no_repeat_ngram_size=3,
-            repetition_penalty=1.1,
-            do_sample=False,
-            num_return_sequences=1
+    return translated_texts
+
+
+def tokenize_batch(batch: list, source_lang: str):
+    """Tokenize a sub-batch of chunks, padded to the longest one."""
+    with TOKENIZER_LOCK:
+        set_src_lang(source_lang)
+        return tokenizer(
+            batch,
+            return_tensors="pt",
+            truncation=True,
+            max_length=MAX_INPUT_TOKENS,
+            padding=True
         )
+
+
+def move_inputs_to_device(inputs):
+    """
+    Start moving tokenized inputs to the model device.
+    On GPU the tensors are pinned and copied asynchronously on COPY_STREAM,
+    so the copy can run while the previous sub-batch is still generating.
+    """
+    if COPY_STREAM is None:
+        return inputs.to(MODEL_DEVICE)
     
-    # Decode translation
-    translated_text = tokenizer.batch_decode(
-        translated_tokens,
-        skip_special_tokens=True
-    )[0]
+    with torch.cuda.stream(COPY_STREAM):
+        return {k: v.pin_memory().to(MODEL_DEVICE, non_blocking=True) for k, v in inputs.items()}
+
+
+def wait_for_inputs(inputs):
+    """Make the current CUDA stream wait until the async copy of inputs has finished."""
+    if COPY_STREAM is None:
+        return inputs
     
-    return translated_text
+    current_stream = torch.cuda.current_stream()
+    current_stream.wait_stream(COPY_STREAM)
+    for tensor in inputs.values():
+        # Tell the allocator the tensor is now used on the compute stream
+        tensor.record_stream(current_stream)
+    return inputs
+
+
+def translate_batch(chunks: list, source_lang: str, target_lang: str) -> list:
+    """
+    Translate a list of text chunks with batched model.generate calls.
+    Chunks are padded into a single tensor per sub-batch so the encoder and
+    beam search run once for the whole sub-batch instead of once per chunk.
+    
+    Returns:
+        List of translated texts in the same order as chunks
+    """
+    if not chunks:
+        return []
+    
+    if translator is not None:
+        return translate_batch_ct2(chunks, source_lang, target_lang)
+    
+    # Get target language token ID
+    forced_bos_token_id = get_lang_token_id(target_lang)
+    
+    batch_size = get_batch_size()
+    batches = [chunks[start:start + batch_size] for start in range(0, len(chunks), batch_size)]
+    
+    translated_texts = []
+    next_inputs = move_inputs_to_device(tokenize_batch(batches[0], source_lang))
+    for index in range(len(batches)):
+        inputs = wait_for_inputs(next_inputs)
+        
+        # Start copying the next sub-batch so the transfer overlaps with this generate
+        if index + 1 < len(batches):
+            next_inputs = move_inputs_to_device(tokenize_batch(batches[index + 1], source_lang))
+        
+        # Size the search to the (padded) input length of this sub-batch
+        in_tokens = inputs["input_ids"].shape[1]
+        # Assisted generation replaces beam search with draft-and-verify greedy decoding
+        num_beams = 1 if assistant_model is not None else get_num_beams(in_tokens)
+        max_new_tokens = get_max_new_tokens(in_tokens)
+        
+        # Beam-only settings; passing them to greedy decoding makes
+        # GenerationConfig.validate warn on every call
+        beam_kwargs = {"early_stopping": False, "length_penalty": 1.2} if num_beams > 1 else {}
+        
+        # Generate translation
+        with torch.inference_mode():
+            translated_tokens = model.generate(
+                input_ids=inputs["input_ids"],
+                attention_mask=inputs["attention_mask"],
+                forced_bos_token_id=forced_bos_token_id,
+                assistant_model=assistant_model,
+                max_new_tokens=max_new_tokens,
+                num_beams=num_beams,
+                no_repeat_ngram_size=3,
+                repetition_penalty=1.1,
+                do_sample=False,
+                num_return_sequences=1,
+                **beam_kwargs
+            )
+        
+        # Decode translations
+        with TOKENIZER_LOCK:
+            translated_texts.extend(tokenizer.batch_decode(
+                translated_tokens,
+                skip_special_tokens=True
+            ))
+    
+    return translated_texts
+
+
+def translate_chunk(text_chunk: str, source_lang: str, target_lang: str) -> str:
+    """
+    Translate a single chunk of text.
+    Thin wrapper around translate_batch for the single-chunk path.
+    """
+    return translate_batch([text_chunk], source_lang, target_lang)[0]
+
+
+def translate_chunks(chunks: list, source_lang: str, target_lang: str, start_index: int = 0) -> list:
+    """
+    Translate a group of chunks in one batch, falling back to one chunk at a time
+    so a single bad chunk doesn't lose the rest of the group.
+    
+    Args:
+        start_index: Position of the first chunk in the full request (for log messages)
+    """
+    try:
+        translated_chunks = translate_batch(chunks, source_lang, target_lang)
+        logger.info(f"Chunks {start_index+1}-{start_index+len(chunks)} translated successfully")
+        return translated_chunks
+    except Exception as batch_error:
+        logger.error(f"Error translating chunks in batch: {str(batch_error)}")
+    
+    translated_chunks = []
+    for i, chunk in enumerate(chunks, start=start_index):
+        try:
+            translated_chunk = translate_chunk(chunk, source_lang, target_lang)
+            translated_chunks.append(translated_chunk)
+            logger.info(f"Chunk {i+1} translated successfully: {len(translated_chunk)} chars")
+        except Exception as chunk_error:
+            logger.error(f"Error translating chunk {i+1}: {str(chunk_error)}")
+            # Continue with other chunks, but log the error
+            translated_chunks.append(f"[Translation error in chunk {i+1}]")
+    return translated_chunks
+
+
+def translate_texts_or_errors(texts: list, source_lang: str, target_lang: str) -> list:
+    """
+    Translate independent request texts in one batch.
+    If the batch fails, retry each text alone so one bad request doesn't fail the others.
+    
+    Returns:
+        List with the translated text, or the raised exception, for each input
+    """
+    try:
+        return translate_batch(texts, source_lang, target_lang)
+    except Exception as batch_error:
+        if len(texts) == 1:
+            return [batch_error]
+        logger.error(f"Error translating request batch, retrying individually: {str(batch_error)}")
+    
+    results = []
+    for text in texts:
+        try:
+            results.append(translate_chunk(text, source_lang, target_lang))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def resolve_request_futures(futures: list, executor_future):
+    """Hand each batched request its result, or the exception it raised."""
+    error = executor_future.exception()
+    results = [error] * len(futures) if error is not None else executor_future.result()
+    for future, result in zip(futures, results):
+        if future.done():
+            # The client went away while the batch was running
+            continue
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+def log_batcher_exit(task):
+    """Log the micro-batcher stopping for any reason other than shutdown."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Request batcher stopped: {str(task.exception())}")
+
+
+def fail_request_futures(futures: list, error: Exception):
+    """Fail every still-pending request future with error."""
+    for future in futures:
+        if not future.done():
+            future.set_exception(error)
+
+
+async def batch_requests():
+    """
+    Background task that groups concurrent single-chunk requests.
+    Waits for a free worker slot (BATCH_SLOTS), then collects requests for up to
+    BATCH_WINDOW_SECONDS (or MAX_BATCH_SIZE of them), groups them by language
+    pair and runs one batched generate per group. While every worker is busy,
+    new requests wait in REQUEST_QUEUE and merge into the next batch instead of
+    queueing one by one inside the executor.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        await BATCH_SLOTS.acquire()
+        pending = [await REQUEST_QUEUE.get()]
+        deadline = loop.time() + BATCH_WINDOW_SECONDS
+        while len(pending) < MAX_BATCH_SIZE:
+            # Take everything already queued before waiting for more
+            try:
+                pending.append(REQUEST_QUEUE.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                pending.append(await asyncio.wait_for(REQUEST_QUEUE.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        
+        # Requests can only share a generate call when source and target match
+        try:
+            groups = {}
+            for text, source_lang, target_lang, future in pending:
+                group = groups.setdefault((source_lang, target_lang), ([], []))
+                group[0].append(text)
+                group[1].append(future)
+        except Exception as e:
+            logger.error(f"Error grouping batched requests: {str(e)}")
+            fail_request_futures([item[-1] for item in pending], e)
+            BATCH_SLOTS.release()
+            continue
+        
+        for group_index, ((source_lang, target_lang), (texts, futures)) in enumerate(groups.items()):
+            # The slot acquired above covers the first group; each further group
+            # needs its own, so at most CHUNK_WORKERS batches are in flight
+            if group_index > 0:
+                await BATCH_SLOTS.acquire()
+            
+            # A failed dispatch (e.g. executor shut down) must not kill the batcher,
+            # or every later request would wait on its future forever
+            try:
+                if len(texts) > 1:
+                    logger.info(f"Batching {len(texts)} concurrent requests ({source_lang} -> {target_lang})")
+                executor_future = loop.run_in_executor(
+                    CHUNK_EXECUTOR,
+                    translate_texts_or_errors,
+                    texts,
+                    source_lang,
+                    target_lang
+                )
+                executor_future.add_done_callback(
+                    functools.partial(resolve_request_futures, futures)
+                )
+                executor_future.add_done_callback(lambda _: BATCH_SLOTS.release())
+            except Exception as e:
+                logger.error(f"Error dispatching batched requests: {str(e)}")
+                fail_request_futures(futures, e)
+                BATCH_SLOTS.release()
+
+
+async def submit_for_batching(text: str, source_lang: str, target_lang: str) -> str:
+    """Queue a single-chunk translation for the micro-batcher and wait for its result."""
+    if BATCHER_TASK is None or BATCHER_TASK.done():
+        raise RuntimeError("Request batcher is not running")
+    future = asyncio.get_running_loop().create_future()
+    await REQUEST_QUEUE.put((text, source_lang, target_lang, future))
+    return await future
+
+
+@functools.lru_cache(maxsize=TOKEN_COUNT_CACHE_SIZE)
+def count_tokens_cached(source_lang: str, text: str) -> int:
+    """Tokenize and count, memoized for repeated short texts."""
+    with TOKENIZER_LOCK:
+        set_src_lang(source_lang)
+        return len(tokenizer.encode(text, add_special_tokens=False))
 
 
 def get_token_count(text: str, source_lang: str) -> int:
     """
     Get accurate token count for a text using the tokenizer.
     This is more accurate than character-based estimation.
+    Short texts go through count_tokens_cached.
     """
     try:
-        tokenizer.src_lang = source_lang
-        encoded = tokenizer.encode(text, add_special_tokens=False)
+        if len(text) < TOKEN_COUNT_CACHE_MAX_CHARS:
+            return count_tokens_cached(source_lang, text)
+        with TOKENIZER_LOCK:
+            set_src_lang(source_lang)
+            encoded = tokenizer.encode(text, add_special_tokens=False)
         return len(encoded)
     except Exception as e:
         logger.warning(f"Error getting token count, using estimation: {str(e)}")
         # Fallback: rough estimation based on language
         # Khmer and other complex scripts may have different ratios
-        if source_lang.startswith('khm_') or source_lang.startswith('zho_') or source_lang.startswith('jpn_'):
+        if source_lang[:4] in COMPLEX_SCRIPTS:
             # Complex scripts: roughly 1 token per 2-3 characters
-            return len(text) // 2.5
+            return int(len(text) / 2.5)
         else:
             # Latin scripts: roughly 1 token per 4 characters
             return len(text) // 4
 
 
-def split_text_into_chunks(text: str, source_lang: str, max_tokens: int = MAX_INPUT_TOKENS, overlap: int = 50) -> list:
+def get_token_counts(texts: list, source_lang: str) -> list:
+    """
+    Get token counts for several texts with a single batched tokenizer call.
+    The fast tokenizer encodes the batch in parallel on the Rust side.
+    """
+    try:
+        with TOKENIZER_LOCK:
+            set_src_lang(source_lang)
+            encoded = tokenizer(texts, add_special_tokens=False, padding=False)
+        return [len(ids) for ids in encoded["input_ids"]]
+    except Exception as e:
+        logger.warning(f"Error getting batched token counts, counting individually: {str(e)}")
+        return [get_token_count(text, source_lang) for text in texts]
+
+
+def get_max_prefix_length(text: str, source_lang: str, max_tokens: int) -> int:
+    """
+    Find the longest prefix of text (in characters) that fits within max_tokens.
+    Tokenizes the text once and reads the answer from the offset mapping,
+    instead of re-tokenizing candidate prefixes.
+    
+    Returns:
+        Character length of the prefix, or 0 if it could not be determined
+    """
+    try:
+        with TOKENIZER_LOCK:
+            set_src_lang(source_lang)
+            encoded = tokenizer(text, return_offsets_mapping=True, add_special_tokens=False)
+    except Exception as e:
+        logger.warning(f"Error getting token offsets: {str(e)}")
+        return 0
+    
+    offsets = encoded["offset_mapping"]
+    if len(offsets) <= max_tokens:
+        return len(text)
+    if max_tokens <= 0:
+        return 0
+    
+    # End character of the last token that still fits
+    return offsets[max_tokens - 1][1]
+
+
+def skip_whitespace(text: str, pos: int) -> int:
+    """Advance pos past any whitespace in text."""
+    while pos < len(text) and text[pos].isspace():
+        pos += 1
+    return pos
+
+
+def find_last_sentence_end(text: str, start: int, end: int, accept_at_end: bool = True) -> int:
+    """
+    Find the position just after the last sentence ending in text[start:end].
+    The ending must be followed by whitespace, or sit at the end of the window
+    when accept_at_end is set. Uses str.rfind per delimiter instead of scanning
+    characters in Python.
+    
+    Returns:
+        Index just after the sentence ending, or -1 if none was found
+    """
+    search_end = end
+    while search_end > start:
+        last = max(text.rfind(ending, start, search_end) for ending in SENTENCE_ENDINGS)
+        if last < 0:
+            return -1
+        
+        next_pos = last + 1
+        if (accept_at_end and next_pos == end) or (next_pos < len(text) and text[next_pos].isspace()):
+            return next_pos
+        
+        # Not a sentence boundary, keep searching before it
+        search_end = last
+    
+    return -1
+
+
+def get_chunk_separator(gap: str) -> str:
+    """
+    Reduce the whitespace between two source chunks to the separator used
+    when joining their translations.
+    """
+    if "\n\n" in gap:
+        return "\n\n"
+    if "\n" in gap:
+        return "\n"
+    return " "
+
+
+def split_text_into_chunks(text: str, source_lang: str, max_tokens: int = MAX_INPUT_TOKENS, overlap: int = 50) -> List[Tuple[str, str]]:
     """
     Split text into chunks based on actual token limits, preserving sentence boundaries.
     
@@ -173,7 +822,9 @@ def split_text_into_chunks(text: str, source_lang: str, max_tokens: int = MAX_IN
         overlap: Number of tokens to overlap between chunks (to preserve context)
     
     Returns:
-        List of text chunks that don't exceed token limits
+        List of (chunk, separator) pairs. Chunks don't exceed token limits; the
+        separator (" ", "\n" or "\n\n") is the break that followed the chunk
+        in the original text, and is empty for the last chunk
     """
     # First check if text fits in one chunk
     token_count = get_token_count(text, source_lang)
@@ -182,103 +833,83 @@ def split_text_into_chunks(text: str, source_lang: str, max_tokens: int = MAX_IN
     safe_max_tokens = max_tokens - 50
     
     if token_count <= safe_max_tokens:
-        return [text]
+        return [(text, "")]
     
     chunks = []
-    remaining = text.strip()
-    
-    # Sentence boundary markers (common across many languages)
-    # Khmer uses ។ (U+17D4) as sentence delimiter
-    sentence_endings = '.!?\n។。！？\n'
+    # Walk a cursor over the text instead of re-slicing the remaining text per chunk
+    text = text.strip()
+    pos = 0
     
     logger.info(f"Splitting text: {len(text)} chars, ~{token_count} tokens into chunks of ~{safe_max_tokens} tokens")
     
-    while remaining:
-        # Try to find a good chunk size by binary search on character length
-        chunk_text = ""
-        best_break = 0
-        
-        # Start with a conservative estimate
-        start_length = min(len(remaining), safe_max_tokens * 2)  # Rough estimate: 2 chars per token
-        search_length = start_length
-        
-        # Binary search for optimal chunk size that fits within token limit
-        low, high = 1, len(remaining)
+    while pos < len(text):
+        # pos always sits on a non-whitespace character, so chunk_text starts here
+        chunk_start = pos
         
-        while low <= high:
-            mid = (low + high) // 2
-            test_chunk = remaining[:mid]
-            test_tokens = get_token_count(test_chunk, source_lang)
-            
-            if test_tokens <= safe_max_tokens:
-                chunk_text = test_chunk
-                best_break = mid
-                low = mid + 1  # Try to get more
-            else:
-                high = mid - 1  # Too long, reduce
+        # Find the longest prefix that fits within the token limit
+        best_break = get_max_prefix_length(text[pos:], source_lang, safe_max_tokens)
+        chunk_end = pos + best_break
+        chunk_text = text[pos:chunk_end]
         
         # If we found a chunk that fits
         if chunk_text and best_break > 0:
             # Try to find a sentence boundary near the end of this chunk
             # Look for sentence endings in the last portion (last 20% of chunk)
-            search_start = max(0, best_break - (best_break // 5))
-            search_text = remaining[search_start:best_break]
+            search_start = pos + max(0, best_break - (best_break // 5))
             
-            # Find the last sentence ending
-            last_sentence_end = -1
-            for i in range(len(search_text) - 1, -1, -1):
-                if search_text[i] in sentence_endings:
-                    # Check if it's followed by whitespace or end of string
-                    if i == len(search_text) - 1 or (i + 1 < len(search_text) and search_text[i + 1].isspace()):
-                        last_sentence_end = search_start + i + 1
-                        break
+            # Find the last sentence ending (followed by whitespace or at the end of the window)
+            last_sentence_end = find_last_sentence_end(text, search_start, chunk_end)
             
             # If we found a sentence boundary, use it
             if last_sentence_end > search_start:
-                chunk_text = remaining[:last_sentence_end].strip()
-                remaining = remaining[last_sentence_end:].strip()
+                chunk_text = text[pos:last_sentence_end].strip()
+                pos = skip_whitespace(text, last_sentence_end)
             else:
                 # No sentence boundary found, split at token limit
                 # Try to split at word boundary if possible (for non-Khmer scripts)
                 if not source_lang.startswith('khm_'):
                     # Look for space near the end
-                    space_pos = chunk_text.rfind(' ', search_start)
-                    if space_pos > search_start * 0.8:  # Only use if it's reasonably near
-                        chunk_text = remaining[:space_pos].strip()
-                        remaining = remaining[space_pos:].strip()
+                    space_pos = text.rfind(' ', search_start, chunk_end)
+                    if space_pos - pos > (search_start - pos) * 0.8:  # Only use if it's reasonably near
+                        chunk_text = text[pos:space_pos].strip()
+                        pos = skip_whitespace(text, space_pos)
                     else:
                         chunk_text = chunk_text.strip()
-                        remaining = remaining[best_break:].strip()
+                        pos = skip_whitespace(text, chunk_end)
                 else:
                     # For Khmer, split at token limit (no word boundaries to rely on)
                     chunk_text = chunk_text.strip()
-                    remaining = remaining[best_break:].strip()
+                    pos = skip_whitespace(text, chunk_end)
         else:
             # Fallback: ensure we always have a chunk
             # Find a safe break point
-            fallback_length = min(len(remaining), safe_max_tokens * 2)
+            fallback_length = min(len(text) - pos, safe_max_tokens * 2)
+            fallback_end = pos + fallback_length
             
-            # Try to find any sentence boundary
-            for i in range(fallback_length - 1, max(0, fallback_length - 500), -1):
-                if remaining[i] in sentence_endings:
-                    if i < len(remaining) - 1 and remaining[i + 1].isspace():
-                        chunk_text = remaining[:i + 1].strip()
-                        remaining = remaining[i + 1:].strip()
-                        break
+            # Try to find any sentence boundary in the last 500 characters
+            sentence_end = find_last_sentence_end(
+                text,
+                pos + max(0, fallback_length - 500) + 1,
+                fallback_end,
+                accept_at_end=False
+            )
+            if sentence_end > 0:
+                chunk_text = text[pos:sentence_end].strip()
+                pos = skip_whitespace(text, sentence_end)
             else:
                 # No sentence boundary found, use word boundary for non-Khmer
                 if not source_lang.startswith('khm_'):
-                    space_pos = remaining.rfind(' ', 0, fallback_length)
-                    if space_pos > 0:
-                        chunk_text = remaining[:space_pos].strip()
-                        remaining = remaining[space_pos:].strip()
+                    space_pos = text.rfind(' ', pos, fallback_end)
+                    if space_pos > pos:
+                        chunk_text = text[pos:space_pos].strip()
+                        pos = skip_whitespace(text, space_pos)
                     else:
-                        chunk_text = remaining[:fallback_length].strip()
-                        remaining = remaining[fallback_length:].strip()
+                        chunk_text = text[pos:fallback_end].strip()
+                        pos = skip_whitespace(text, fallback_end)
                 else:
                     # For Khmer, just split at estimated limit
-                    chunk_text = remaining[:fallback_length].strip()
-                    remaining = remaining[fallback_length:].strip()
+                    chunk_text = text[pos:fallback_end].strip()
+                    pos = skip_whitespace(text, fallback_end)
         
         if chunk_text:
             # Verify this chunk doesn't exceed token limit
@@ -287,34 +918,23 @@ def split_text_into_chunks(text: str, source_lang: str, max_tokens: int = MAX_IN
                 # If it still exceeds, reduce further by finding a safe break
                 logger.warning(f"Chunk still too large ({chunk_tokens} tokens), reducing...")
                 
-                # Binary search to find a safe length
-                low, high = 1, len(chunk_text)
-                safe_chunk = ""
-                safe_length = 0
+                # Find a safe length from the chunk's own token offsets
+                safe_length = get_max_prefix_length(chunk_text, source_lang, safe_max_tokens)
+                safe_chunk = chunk_text[:safe_length]
                 
-                while low <= high:
-                    mid = (low + high) // 2
-                    test_chunk = chunk_text[:mid]
-                    test_tokens = get_token_count(test_chunk, source_lang)
-                    
-                    if test_tokens <= safe_max_tokens:
-                        safe_chunk = test_chunk
-                        safe_length = mid
-                        low = mid + 1
-                    else:
-                        high = mid - 1
-                
-                if safe_chunk:
-                    chunk_text = safe_chunk.strip()
-                    remaining = chunk_text[safe_length:] + remaining
-                else:
+                if not safe_chunk:
                     # Last resort: take 80% of the chunk
-                    reduced_length = int(len(chunk_text) * 0.8)
-                    chunk_text = chunk_text[:reduced_length].strip()
-                    remaining = chunk_text[reduced_length:] + remaining
+                    safe_length = max(1, int(len(chunk_text) * 0.8))
+                
+                # Resume right after the kept part so the trimmed text goes into the next chunk
+                chunk_text = chunk_text[:safe_length].strip()
+                pos = skip_whitespace(text, chunk_start + safe_length)
+                chunk_tokens = get_token_count(chunk_text, source_lang)
             
-            chunks.append(chunk_text)
-            logger.info(f"Created chunk {len(chunks)}: {len(chunk_text)} chars, ~{get_token_count(chunk_text, source_lang)} tokens")
+            # Whitespace skipped between this chunk and the next one
+            separator = get_chunk_separator(text[chunk_start + len(chunk_text):pos]) if pos < len(text) else ""
+            chunks.append((chunk_text, separator))
+            logger.info(f"Created chunk {len(chunks)}: {len(chunk_text)} chars, ~{chunk_tokens} tokens")
     
     return chunks
 
@@ -337,7 +957,7 @@ async def translate(request: TranslationRequest):
         HTTPException: If model is not loaded, text is too long, or translation fails
     """
     # Check if model is loaded
-    if model is None or tokenizer is None:
+    if (model is None and translator is None) or tokenizer is None:
         raise HTTPException(
             status_code=503,
             detail="Translation model is not loaded. Please wait for the model to initialize."
@@ -357,6 +977,10 @@ async def translate(request: TranslationRequest):
         )
     
     try:
+        # Reject unknown language codes up front (KeyError -> 400 below)
+        get_lang_token_id(request.source_lang)
+        get_lang_token_id(request.target_lang)
+        
         # Accurately detect token length before translation
         token_count = get_token_count(request.text, request.source_lang)
         
@@ -370,44 +994,52 @@ async def translate(request: TranslationRequest):
             logger.info(f"Text exceeds token limit. Splitting into chunks...")
             
             # Split text into chunks based on actual token counts
-            chunks = split_text_into_chunks(
+            split_chunks = split_text_into_chunks(
                 request.text, 
                 source_lang=request.source_lang,
                 max_tokens=safe_max_tokens
             )
+            chunks = [chunk for chunk, _ in split_chunks]
+            separators = [separator for _, separator in split_chunks]
             
             logger.info(f"Split into {len(chunks)} chunks")
             
-            # Translate each chunk sequentially
-            translated_chunks = []
-            for i, chunk in enumerate(chunks):
-                chunk_tokens = get_token_count(chunk, request.source_lang)
+            chunk_token_counts = get_token_counts(chunks, request.source_lang)
+            for i, (chunk, chunk_tokens) in enumerate(zip(chunks, chunk_token_counts)):
                 logger.info(
-                    f"Translating chunk {i+1}/{len(chunks)}: "
+                    f"Chunk {i+1}/{len(chunks)}: "
                     f"{len(chunk)} chars, {chunk_tokens} tokens"
                 )
-                
-                try:
-                    translated_chunk = translate_chunk(chunk, request.source_lang, request.target_lang)
-                    translated_chunks.append(translated_chunk)
-                    logger.info(f"Chunk {i+1} translated successfully: {len(translated_chunk)} chars")
-                except Exception as chunk_error:
-                    logger.error(f"Error translating chunk {i+1}: {str(chunk_error)}")
-                    # Continue with other chunks, but log the error
-                    translated_chunks.append(f"[Translation error in chunk {i+1}]")
             
-            # Recombine results in correct order
-            # Join with space, but preserve paragraph breaks (double newlines)
-            translated_text = " ".join(translated_chunks)
+            # Give each worker a contiguous run of whole sub-batches. Batches are never
+            # shrunk to spread chunks over workers, and a worker with several sub-batches
+            # gets them in one translate_batch call so it can prefetch the next one's
+            # inputs while generating the current one
+            batch_size = get_batch_size()
+            num_batches = -(-len(chunks) // batch_size)
+            group_size = -(-num_batches // CHUNK_WORKERS) * batch_size
+            loop = asyncio.get_running_loop()
+            batch_results = await asyncio.gather(*[
+                loop.run_in_executor(
+                    CHUNK_EXECUTOR,
+                    translate_chunks,
+                    chunks[start:start + group_size],
+                    request.source_lang,
+                    request.target_lang,
+                    start
+                )
+                for start in range(0, len(chunks), group_size)
+            ])
+            
+            # gather preserves submission order
+            translated_chunks = [chunk for batch in batch_results for chunk in batch]
             
-            # Restore double newlines that might have been lost
-            # This helps preserve paragraph structure
-            if "\n\n" in request.text:
-                # Count double newlines in original
-                original_paragraphs = request.text.split("\n\n")
-                if len(original_paragraphs) > 1:
-                    # Try to maintain paragraph structure
-                    translated_text = translated_text.replace(". ", ".\n\n", len(original_paragraphs) - 1)
+            # Recombine results in correct order, keeping the line and
+            # paragraph breaks that followed each chunk in the original
+            translated_text = "".join(
+                translated_chunk + separator
+                for translated_chunk, separator in zip(translated_chunks, separators)
+            )
             
             logger.info(
                 f"Completed translation of {len(chunks)} chunks: "
@@ -416,7 +1048,13 @@ async def translate(request: TranslationRequest):
         else:
             # Text fits in single chunk - translate directly
             logger.info(f"Text fits in single chunk, translating directly...")
-            translated_text = translate_chunk(request.text, request.source_lang, request.target_lang)
+            # Queue for micro-batching with other concurrent requests; generate runs
+            # on the worker pool so the event loop keeps serving other requests
+            translated_text = await submit_for_batching(
+                request.text,
+                request.source_lang,
+                request.target_lang
+            )
             
             # Verify no truncation occurred
             input_tokens = get_token_count(request.text, request.source_lang)
@@ -452,28 +1090,7 @@ async def get_languages():
     Returns a subset of common languages with their NLLB codes.
     """
     return {
-        "languages": [
-            {"code": "eng_Latn", "name": "English"},
-            {"code": "khm_Khmr", "name": "Khmer"},
-            {"code": "spa_Latn", "name": "Spanish"},
-            {"code": "fra_Latn", "name": "French"},
-            {"code": "deu_Latn", "name": "German"},
-            {"code": "ita_Latn", "name": "Italian"},
-            {"code": "por_Latn", "name": "Portuguese"},
-            {"code": "rus_Cyrl", "name": "Russian"},
-            {"code": "zho_Hans", "name": "Chinese (Simplified)"},
-            {"code": "zho_Hant", "name": "Chinese (Traditional)"},
-            {"code": "jpn_Jpan", "name": "Japanese"},
-            {"code": "kor_Hang", "name": "Korean"},
-            {"code": "ara_Arab", "name": "Arabic"},
-            {"code": "hin_Deva", "name": "Hindi"},
-            {"code": "tha_Thai", "name": "Thai"},
-            {"code": "vie_Latn", "name": "Vietnamese"},
-            {"code": "ind_Latn", "name": "Indonesian"},
-            {"code": "tam_Taml", "name": "Tamil"},
-            {"code": "tur_Latn", "name": "Turkish"},
-            {"code": "pol_Latn", "name": "Polish"},
-        ]
+        "languages": SUPPORTED_LANGUAGES
     }
 
 